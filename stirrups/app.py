@@ -1,20 +1,30 @@
-import inspect
-
-from typing import Any, Dict, Callable, Iterable, Optional, Type, Union
+import importlib
+import sys
+
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Optional,
+    Set,
+    Type,
+    Union
+)
 
 from .context import ContextType
-from .exceptions import ItemNotFound, IncludeModuleError
+from .exceptions import IncludeModuleError
 from .injection import (
     Factory,
     Injectable,
     Instance,
     Provider,
-    Registry,
     injectable_factory
 )
 
 
 ROOT = '__root'
+_ROOT_SET = frozenset((ROOT,))
 
 
 class App:
@@ -23,18 +33,25 @@ class App:
     There is generally a single instance of App per project.
     """
 
+    __slots__ = (
+        '_mount',
+        '_providers',
+        '_root_providers',
+        '_includes',
+    )
+
     def __init__(
         self,
         mount='mount',
     ):
         self._mount = mount
-        self._providers = Registry[Provider]()
-        self._includes = []
+        self._providers: Dict[str, Provider] = {}
+        self._root_providers = [self._get_scope_provider(ROOT)]
+        self._includes: Optional[Set[str]] = None
 
     def register(
         self,
         injectable: Injectable[Any],
-        *,
         aslist: bool = False,
         force: bool = False,
         key: Optional[str] = None,
@@ -101,14 +118,7 @@ class App:
         else:
             injectable = Instance(item)
 
-        self.register(
-            injectable,
-            aslist=aslist,
-            force=force,
-            key=key,
-            iface=iface,
-            scope=scope
-        )
+        self.register(injectable, aslist, force, key, iface, scope)
 
     def factory(
         self,
@@ -137,14 +147,7 @@ class App:
                 item,
                 cache=cache
             )
-        self.register(
-            injectable,
-            aslist=aslist,
-            force=force,
-            key=key,
-            iface=iface,
-            scope=scope
-        )
+        self.register(injectable, aslist, force, key, iface, scope)
 
     def create_context(
         self,
@@ -172,13 +175,15 @@ class App:
         Returns:
             ContextType: The context instance.
         """
-        scopes = set([ROOT] + list(scopes or []))
+        if not scopes and not kwargs:
+            return context_cls(providers=self._root_providers)
+
+        scopes = _ROOT_SET.union(scopes) if scopes else _ROOT_SET
         providers = [
             self._get_scope_provider(scope) for scope in scopes
         ]
 
-        kwargs = dict(kwargs) if kwargs else {}
-        context = context_cls(providers=providers, **kwargs)
+        context = context_cls(providers=providers, **(kwargs or {}))
 
         return context
 
@@ -187,6 +192,9 @@ class App:
         of that module. Additional `*args` or `**kwargs` are passed
         along to the `mount` method.
 
+        A module is only included once, further includes of the
+        same module are ignored.
+
         Args:
             path (str):
                 The module's path. Can be absolute or relative.
@@ -196,20 +204,34 @@ class App:
                 Raised if the module doens't implement the `mount` method.
         """
         if path.startswith('.'):
-            origin = inspect.stack()[1]
-            here = inspect.getmodule(origin[0])
+            frame = sys._getframe(1)
+            here = sys.modules.get(frame.f_globals.get('__name__'))
             assert here is not None
-            path = '{}{}'.format(here.__name__, path)
+            path = here.__name__ + path
+
+        includes = self._includes
+        if includes is None:
+            includes = self._includes = set()
+        elif path in includes:
+            return
 
         mount_name = self._mount
-        module = __import__(path, globals(), locals(), [mount_name], 0)
+        module = sys.modules.get(path)
+        if module is None:
+            module = importlib.import_module(path)
         try:
             mount = getattr(module, mount_name)
         except AttributeError:
             raise IncludeModuleError(module, mount_name)
 
-        mount(self, *args, **kwargs)
-        self._includes.append(path)
+        # Mark the module as included before mounting it so modules
+        # including each other don't loop
+        includes.add(path)
+        try:
+            mount(self, *args, **kwargs)
+        except BaseException:
+            includes.discard(path)
+            raise
 
     def _get_scope_provider(self, scope: str) -> Provider:
         """Get the provider for a named scope.
@@ -220,15 +242,9 @@ class App:
         Returns:
             Provider: The provider instance.
         """
-        try:
-            provider = self._providers.get(scope)
-        except ItemNotFound:
+        provider = self._providers.get(scope)
+        if provider is None:
             provider = Provider(scope)
-            self._providers.register(
-                provider,
-                scope,
-                aslist=False,
-                force=False,
-            )
+            self._providers[scope] = provider
 
         return provider
@@ -2,8 +2,10 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Iterable,
     List,
     Optional,
+    Tuple,
     Type,
     TypedDict,
     TypeVar,
@@ -18,13 +20,15 @@ from .injection import (
     Instance,
     ItemType,
     Provider,
-    generate_iface_key,
     injectable_factory,
 )
 
 
 ContextType = TypeVar('ContextType', bound='Context')
 
+# Shared default for args. Injectables that mutate args get a copy.
+_EMPTY_ARGS: Tuple[Any, ...] = ()
+
 InspectContextDictItemDep = TypedDict(
     'InspectContextDictItemDep',
     key=str,
@@ -40,23 +44,28 @@ InspectContextDictItem = TypedDict(
 
 
 class InspectContextResult:
+    __slots__ = ('injectables',)
 
     def __init__(self, injectables: Dict[str, InjectableMeta]):
         self.injectables = injectables
 
-    def to_dict(self) -> Dict[str, InspectContextDictItem]:
-        dic = {}
-        for key, injectable_meta in self.injectables.items():
-            item = injectable_meta['item']
-            if isinstance(item, list):
-                dic[key] = [
-                    self._item_to_dict(key, i)
-                    for i in item
-                ]
-                item = [str(i) for i in item]
-            else:
-                dic[key] = self._item_to_dict(key, item)
-        return dic
+    def to_dict(self) -> Dict[
+        str,
+        Union[InspectContextDictItem, List[InspectContextDictItem]]
+    ]:
+        return {
+            key: self._meta_to_dict(key, injectable_meta['item'])
+            for key, injectable_meta in self.injectables.items()
+        }
+
+    def _meta_to_dict(
+        self,
+        key: str,
+        item: Union[Injectable, List[Injectable]]
+    ) -> Union[InspectContextDictItem, List[InspectContextDictItem]]:
+        if isinstance(item, list):
+            return [self._item_to_dict(key, i) for i in item]
+        return self._item_to_dict(key, item)
 
     def _item_to_dict(
         self,
@@ -69,24 +78,24 @@ class InspectContextResult:
             'deps': [
                 {
                     'param': param,
-                    'key': generate_iface_key(iface)
+                    'key': dep_key
                 }
-                for param, iface in item.dependencies
-                if iface is not None
+                for param, dep_key in item.describe_dependencies()
             ]
         }
 
 
 class Context:
+    __slots__ = ('injector', 'local_provider')
+
     injector: Injector
 
     def __init__(
         self,
         *,
-        providers: Optional[List[Provider]] = None,
+        providers: Optional[Iterable[Provider]] = None,
         **kwargs: Any
     ):
-        providers = providers or []
         self.local_provider = Provider('local')
         self.local_provider.register(
             Instance(self),
@@ -95,12 +104,14 @@ class Context:
             key=None,
             iface=self.__class__,
         )
-        self.injector = Injector([self.local_provider, *providers], self)
+        self.injector = Injector(
+            [self.local_provider, *(providers or ())],
+            self
+        )
 
     def register(
         self,
         injectable: Injectable[Any],
-        *,
         aslist: bool = False,
         force: bool = False,
         key: Optional[str] = None,
@@ -129,13 +140,7 @@ class Context:
         else:
             injectable = Instance(item)
 
-        self.register(
-            injectable,
-            aslist=aslist,
-            force=force,
-            key=key,
-            iface=iface,
-        )
+        self.register(injectable, aslist, force, key, iface)
 
     def factory(
         self,
@@ -154,13 +159,7 @@ class Context:
                 item,
                 cache=cache
             )
-        return self.register(
-            injectable,
-            aslist=aslist,
-            force=force,
-            key=key,
-            iface=iface,
-        )
+        return self.register(injectable, aslist, force, key, iface)
 
     def resolve(
         self,
@@ -168,12 +167,10 @@ class Context:
         args: Optional[List[Any]] = None,
         kwargs: Optional[Dict[str, Any]] = None
     ) -> ItemType:
-        args = args or []
-        kwargs = kwargs or {}
         return self.injector.resolve(
             injectable_factory(factory, cache=False),
-            args=[*args],
-            kwargs={**kwargs}
+            args=args or _EMPTY_ARGS,
+            kwargs=kwargs or {}
         )
 
     def get(
@@ -184,13 +181,11 @@ class Context:
         args: Optional[List[Any]] = None,
         kwargs: Optional[Dict[str, Any]] = None
     ) -> ItemType:
-        args = args or []
-        kwargs = kwargs or {}
         return self.injector.get(
             iface,
             key=key,
-            args=[*args],
-            kwargs={**kwargs}
+            args=args or _EMPTY_ARGS,
+            kwargs=kwargs or {}
         )
 
     def get_list(
@@ -201,20 +196,20 @@ class Context:
         args: Optional[List[Any]] = None,
         kwargs: Optional[Dict[str, Any]] = None
     ) -> List[ItemType]:
-        args = args or []
-        kwargs = kwargs or {}
         return self.injector.get_list(
             iface,
             key=key,
-            args=[*args],
-            kwargs={**kwargs}
+            args=args or _EMPTY_ARGS,
+            kwargs=kwargs or {}
         )
 
     def inspect(self) -> InspectContextResult:
         providers = self.injector._providers
-        unique_injectables = {}
-        for provider in reversed(providers):
-            injectables = provider.describe_injectables()
-            for injectable_meta in injectables:
-                unique_injectables[injectable_meta['key']] = injectable_meta
+        unique_injectables: Dict[str, InjectableMeta] = {}
+        for provider in providers:
+            # Build the meta of the first injectable found for a key only,
+            # the others are shadowed
+            for key, item in provider.iter_injectables():
+                if key not in unique_injectables:
+                    unique_injectables[key] = {'key': key, 'item': item}
         return InspectContextResult(unique_injectables)
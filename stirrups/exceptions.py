@@ -1,4 +1,4 @@
-from typing import Any, Union
+from typing import Any, List, Union
 
 
 class StirrupsError(Exception):
@@ -6,62 +6,70 @@ class StirrupsError(Exception):
 
 
 class IncludeModuleError(StirrupsError):
+    _MSG = (
+        'Expected to find a method named "{}" in module "{}".'
+        ' The module cannot be included.'
+    )
 
     def __init__(self, module: object, mount: str):
-        super().__init__(
-            'Expected to find a method named "{}" in module "{}".'
-            ' The module cannot be included.'.format(
-                mount,
-                module
-            )
-        )
+        super().__init__(self._MSG.format(mount, module))
         self.module = module
         self.mount = mount
 
 
 class InjectionError(StirrupsError):
+    _MSG = 'Failed to inject: {}.'
+    _MSG_WITH_KEY = 'Failed to inject: {} with key: {}.'
 
     def __init__(self, iface: Any, *, key: Union[str, None]):
-        msg = f'Failed to inject: {str(iface)}'
         if key:
-            msg = f'{msg} with key: {key}'
-        super().__init__(f'{msg}.')
+            msg = self._MSG_WITH_KEY.format(iface, key)
+        else:
+            msg = self._MSG.format(iface)
+        super().__init__(msg)
         self.iface = iface
         self.key = key
 
 
 class DependencyInjectionError(StirrupsError):
+    _MSG = 'Failed to inject dependency: {}: {}.'
 
     def __init__(self, key: str, iface: Any):
-        super().__init__(
-            'Failed to inject dependency: {}: {}.'.format(key, str(iface))
-        )
+        super().__init__(self._MSG.format(key, iface))
         self.iface = iface
 
 
+class CircularDependencyError(StirrupsError):
+    _MSG = 'Circular dependency detected: {}.'
+
+    def __init__(self, path: List[Any]):
+        super().__init__(self._MSG.format(' -> '.join(map(str, path))))
+        self.path = path
+
+
 class BadSignature(StirrupsError):
+    _MSG = 'Argument "{}" is not annotated. Can\'t inject dependency.'
 
     def __init__(self, arg: str):
-        super().__init__(
-            'Argument "{}" is not annotated. '
-            'Can\'t inject dependency.'.format(arg)
-        )
+        super().__init__(self._MSG.format(arg))
 
 
 class ItemExists(StirrupsError):
+    _MSG = (
+        'An item is already registered under that key: {}. '
+        'Use force=true to override'
+    )
 
     def __init__(self, key: str):
-        super().__init__(
-            'An item is already registered under that key: {}. '
-            'Use force=true to override'.format(key)
-        )
+        super().__init__(self._MSG.format(key))
         self.key = key
 
 
 class ItemNotFound(StirrupsError):
+    _MSG = 'No item found at key: {}'
 
     def __init__(self, key: str):
-        super().__init__('No item found at key: {}'.format(key))
+        super().__init__(self._MSG.format(key))
         self.key = key
 
 
@@ -1,6 +1,9 @@
 import abc
 import dataclasses
 import inspect
+import sys
+import threading
+import weakref
 
 from typing import (
     TYPE_CHECKING,
@@ -8,7 +11,11 @@ from typing import (
     Callable,
     Dict,
     Generic,
+    Iterator,
     List,
+    Mapping,
+    NamedTuple,
+    Sequence,
     Tuple,
     Type,
     TypedDict,
@@ -20,6 +27,7 @@ from typing import (
 
 from .exceptions import (
     BadSignature,
+    CircularDependencyError,
     DependencyInjectionError,
     InjectionError,
     ItemExists,
@@ -35,6 +43,9 @@ if TYPE_CHECKING:
 
 ItemType = TypeVar('ItemType')
 
+# Marks a missing cache entry, cached instances may be None
+_MISSING = object()
+
 InjectableMeta = TypedDict(
     'InjectableMeta',
     key=str,
@@ -42,17 +53,47 @@ InjectableMeta = TypedDict(
 )
 
 
+class _ParamPlan(NamedTuple):
+    index: int
+    param: inspect.Parameter
+    iface: Any
+    key: Union[str, None]
+    positional: bool
+    is_context: bool
+
+
+def _compute_plan(
+    params: List[Tuple[inspect.Parameter, Any]]
+) -> Tuple[_ParamPlan, ...]:
+    # Unannotated variable params are never injected, leave them out.
+    # The registration key of each dependency is generated once here
+    # rather than on every injection.
+    return tuple(
+        _ParamPlan(
+            index,
+            param,
+            iface,
+            generate_iface_key(iface) if iface is not None else None,
+            param_is_positionnal(param),
+            _is_context_iface(iface)
+        )
+        for index, (param, iface) in enumerate(params)
+        if iface is not None or not param_is_variable(param)
+    )
+
+
 def _get_param_value(
     param: inspect.Parameter,
     iface: Any,
-    context: 'Context'
+    context: 'Context',
+    key: Union[str, None] = None
 ) -> Any:
     name = param.name
     if not iface:
         raise BadSignature(name)
 
     try:
-        value = _get_value_from_context(iface, context)
+        value = context.get(iface, key=key)
     except InjectionError:
         raise DependencyInjectionError(name, iface)
 
@@ -60,9 +101,7 @@ def _get_param_value(
 
 
 def _get_value_from_context(iface: Any, context: 'Context') -> Any:
-    from .context import Context
-    if inspect.isclass(iface) \
-            and issubclass(iface, Context) or iface == Context:
+    if _is_context_iface(iface):
         value = context
     else:
         value = context.get(iface)
@@ -70,7 +109,15 @@ def _get_value_from_context(iface: Any, context: 'Context') -> Any:
     return value
 
 
+def _is_context_iface(iface: Any) -> bool:
+    from .context import Context
+    return inspect.isclass(iface) \
+        and issubclass(iface, Context) or iface == Context
+
+
 class Injectable(Generic[ItemType], metaclass=abc.ABCMeta):
+    __slots__ = ('item',)
+
     item: Any
 
     def __str__(self):
@@ -80,8 +127,8 @@ class Injectable(Generic[ItemType], metaclass=abc.ABCMeta):
     def __call__(
         self,
         context: 'Context',
-        args: List,
-        kwargs: Dict
+        args: Sequence,
+        kwargs: Mapping
     ) -> ItemType:
         pass
 
@@ -89,23 +136,32 @@ class Injectable(Generic[ItemType], metaclass=abc.ABCMeta):
     def dependencies(self) -> List[Tuple[str, Any]]:
         ...
 
+    def describe_dependencies(self) -> Tuple[Tuple[str, str], ...]:
+        return tuple(
+            (param, generate_iface_key(iface))
+            for param, iface in self.dependencies
+            if iface is not None
+        )
+
     def get_cache_key(
         self,
-        args: List,
-        kwargs: Dict
+        args: Sequence,
+        kwargs: Mapping
     ) -> Union[str, None]:
         return None
 
 
 class Instance(Injectable[ItemType]):
+    __slots__ = ()
+
     def __init__(self, instance: ItemType):
         self.item = instance
 
     def __call__(
         self,
         context: 'Context',
-        args: List,
-        kwargs: Dict
+        args: Sequence,
+        kwargs: Mapping
     ) -> ItemType:
         return self.item
 
@@ -115,6 +171,7 @@ class Instance(Injectable[ItemType]):
 
 
 class Factory(Injectable[ItemType]):
+    __slots__ = ('cache', '_str', '_cache_key', '_described_dependencies')
 
     def __init__(
         self,
@@ -124,18 +181,65 @@ class Factory(Injectable[ItemType]):
     ):
         self.item = factory
         self.cache = cache
+        self._str: Union[str, None] = None
+        self._cache_key = _format_key(str(self)) if cache else None
+        self._described_dependencies: Union[
+            Tuple[Tuple[str, str], ...],
+            None
+        ] = None
+
+    def __str__(self):
+        # A factory is a class or a function, its rendering doesn't
+        # change and can be cached
+        rendered = self._str
+        if rendered is None:
+            rendered = self._str = str(self.item)
+        return rendered
+
+    def _introspect(
+        self,
+        cache: weakref.WeakKeyDictionary,
+        compute: Callable[[], Any]
+    ) -> Any:
+        # Introspecting a factory is costly. Cache the result per
+        # factory so it's done once, even when the same callable is
+        # wrapped again (e.g. Context.resolve). The cache is weak but
+        # a factory whose params or hints refer to itself (e.g. a
+        # `parent: 'Node'` param) is referenced by its own entry and
+        # is never collected.
+        factory = self.item
+        try:
+            introspected = cache.get(factory)
+        except TypeError:
+            # The factory is not hashable or can't be weakly referenced
+            return compute()
+
+        if introspected is None:
+            introspected = compute()
+            cache[factory] = introspected
+        return introspected
+
+    def describe_dependencies(self) -> Tuple[Tuple[str, str], ...]:
+        # The dependencies of a factory are computed once at
+        # construction so their description can be cached.
+        described = self._described_dependencies
+        if described is None:
+            described = super().describe_dependencies()
+            self._described_dependencies = described
+        return described
 
     def get_cache_key(
         self,
-        args: List,
-        kwargs: Dict
+        args: Sequence,
+        kwargs: Mapping
     ) -> Union[str, None]:
-        if not self.cache:
-            return None
-        return str(self.item).replace('.', ':').replace('\'', '')
+        return self._cache_key
 
 
 class FunctionFactory(Factory[ItemType]):
+    __slots__ = ('params', 'plan', 'wants_context')
+
+    _introspected: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
 
     def __init__(
         self,
@@ -144,22 +248,47 @@ class FunctionFactory(Factory[ItemType]):
         cache: bool
     ):
         super().__init__(factory, cache=cache)
-        self.params = self._compute_params()
+        self.params, self.plan, self.wants_context = self._introspect(
+            self._introspected,
+            self._compute_introspection
+        )
 
     def __call__(
         self,
         context: 'Context',
-        args: List,
-        kwargs: Dict
+        args: Sequence,
+        kwargs: Mapping
     ) -> ItemType:
         func = self.item
-        self._inject_func_params(args, kwargs, context)
+        if self.wants_context and not args and not kwargs:
+            return func(context)
+
+        # Only copy args and kwargs when some params are left to inject
+        plan = self.plan
+        if plan and len(args) <= plan[-1].index:
+            args = list(args)
+            kwargs = dict(kwargs)
+            self._inject_func_params(args, kwargs, context)
         return func(*args, **kwargs)
 
     @property
     def dependencies(self) -> List[Tuple[str, Any]]:
         return [(param.name, iface) for param, iface in self.params]
 
+    def _compute_introspection(self) -> Tuple[
+        List[Tuple[inspect.Parameter, Any]],
+        Tuple[_ParamPlan, ...],
+        bool
+    ]:
+        params = self._compute_params()
+        # A function with a single, unannotated, param receives the context
+        wants_context = (
+            len(params) == 1
+            and not params[0][1]
+            and param_is_positionnal(params[0][0])
+        )
+        return params, _compute_plan(params), wants_context
+
     def _compute_params(self) -> List[Tuple[inspect.Parameter, Any]]:
         func = self.item
         try:
@@ -189,29 +318,24 @@ class FunctionFactory(Factory[ItemType]):
         kwargs: Dict,
         context: 'Context'
     ):
-        params = self.params
         args_count = len(args)
 
-        for index, (param, iface) in enumerate(params):
+        for index, param, iface, key, is_positional, is_context in self.plan:
             if index < args_count:
                 continue
 
-            is_positional = param_is_positionnal(param)
             if not is_positional and param.name in kwargs:
                 continue
 
-            if iface is None and param_is_variable(param):
-                continue
-
-            try:
-                value = _get_param_value(param, iface, context)
-            except BadSignature as exc:
-                if len(params) == 1 and not args:
-                    value = context
-                else:
-                    raise exc
-            except WrapperDescriptorError:
-                continue
+            if is_context or (
+                not iface and len(self.params) == 1 and not args
+            ):
+                value = context
+            else:
+                try:
+                    value = _get_param_value(param, iface, context, key)
+                except WrapperDescriptorError:
+                    continue
 
             if is_positional:
                 args.append(value)
@@ -220,6 +344,9 @@ class FunctionFactory(Factory[ItemType]):
 
 
 class ClassFactory(Factory[ItemType]):
+    __slots__ = ('params', 'plan', 'hints')
+
+    _introspected: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
 
     def __init__(
         self,
@@ -228,17 +355,24 @@ class ClassFactory(Factory[ItemType]):
         cache: bool
     ):
         super().__init__(factory, cache=cache)
-        self.params = self._compute_params()
-        self.hints = self._compute_class_hints()
+        self.params, self.plan, self.hints = self._introspect(
+            self._introspected,
+            self._compute_introspection
+        )
 
     def __call__(
         self,
         context: 'Context',
-        args: List,
-        kwargs: Dict
+        args: Sequence,
+        kwargs: Mapping
     ) -> ItemType:
         cls = self.item
-        self._inject_constructor_params(args, kwargs, context)
+        # Only copy args and kwargs when some params are left to inject
+        plan = self.plan
+        if plan and len(args) <= plan[-1].index:
+            args = list(args)
+            kwargs = dict(kwargs)
+            self._inject_constructor_params(args, kwargs, context)
 
         instance = cls(*args, **kwargs)
         self._inject_class_hints(instance, context)
@@ -256,6 +390,14 @@ class ClassFactory(Factory[ItemType]):
             *((key, value) for key, value in self.hints.items())
         ]
 
+    def _compute_introspection(self) -> Tuple[
+        List[Tuple[inspect.Parameter, Any]],
+        Tuple[_ParamPlan, ...],
+        Dict[str, Any]
+    ]:
+        params = self._compute_params()
+        return params, _compute_plan(params), self._compute_class_hints()
+
     def _compute_params(self) -> List[Tuple[inspect.Parameter, Any]]:
         cls = self.item
         mro = inspect.getmro(cls)
@@ -304,28 +446,27 @@ class ClassFactory(Factory[ItemType]):
         kwargs: Dict,
         context: 'Context'
     ):
-        params = self.params
         args_count = len(args)
 
-        for index, (param, iface) in enumerate(params):
+        for index, param, iface, key, is_positional, is_context in self.plan:
             if index < args_count:
                 continue
 
-            is_positional = param_is_positionnal(param)
             if not is_positional and param.name in kwargs:
                 continue
 
-            if iface is None and param_is_variable(param):
-                continue
-
-            try:
-                value = _get_param_value(
-                    param,
-                    iface,
-                    context
-                )
-            except WrapperDescriptorError:
-                continue
+            if is_context:
+                value = context
+            else:
+                try:
+                    value = _get_param_value(
+                        param,
+                        iface,
+                        context,
+                        key
+                    )
+                except WrapperDescriptorError:
+                    continue
 
             if is_positional:
                 args.append(value)
@@ -350,6 +491,7 @@ class ClassFactory(Factory[ItemType]):
 
 
 class DataclassFactory(Factory[ItemType]):
+    __slots__ = ('hints',)
 
     def __init__(
         self,
@@ -363,11 +505,13 @@ class DataclassFactory(Factory[ItemType]):
     def __call__(
         self,
         context: 'Context',
-        args: List,
-        kwargs: Dict
+        args: Sequence,
+        kwargs: Mapping
     ) -> ItemType:
         datacls = self.item
-        self._inject_dataclass_hints(kwargs, context)
+        if self.hints:
+            kwargs = dict(kwargs)
+            self._inject_dataclass_hints(kwargs, context)
         return datacls(**kwargs)
 
     @property
@@ -396,6 +540,20 @@ class DataclassFactory(Factory[ItemType]):
                 kwargs[key] = arg
 
 
+# (Injector, Injectable) pairs being resolved by the current thread, in
+# order. Used as an ordered set to detect cycles without relying on the
+# recursion limit.
+_resolution = threading.local()
+
+# Injectables that never mutate args and kwargs, or copy them first
+_COPYING_INJECTABLES = frozenset((
+    Instance,
+    FunctionFactory,
+    ClassFactory,
+    DataclassFactory,
+))
+
+
 def injectable_factory(
     factory: Callable[..., Any],
     cache: bool,
@@ -417,10 +575,16 @@ def generate_iface_key(iface: Any) -> str:
         base = iface.__name__
     else:
         base = str(iface)
-    return base.replace('.', ':').replace('\'', '')
+    return _format_key(base)
+
+
+def _format_key(base: str) -> str:
+    # Interned keys let registry lookups match on identity
+    return sys.intern(base.replace('.', ':').replace('\'', ''))
 
 
 class Registry(Generic[ItemType]):
+    __slots__ = ('_items',)
 
     def __init__(self):
         self._items = {}
@@ -434,6 +598,9 @@ class Registry(Generic[ItemType]):
         except KeyError:
             raise ItemNotFound(key)
 
+    def find(self, key: str) -> Union[ItemType, None]:
+        return self._items.get(key)
+
     def get_list(self, key: str) -> List[ItemType]:
         try:
             items = self._items[key]
@@ -478,6 +645,7 @@ class Registry(Generic[ItemType]):
 
 
 class Provider(Generic[ItemType]):
+    __slots__ = ('name', 'items')
 
     def __init__(self, name: str):
         self.name = name
@@ -492,6 +660,15 @@ class Provider(Generic[ItemType]):
         key = key or generate_iface_key(iface)
         return self.items.get(key)
 
+    def find(
+        self,
+        iface: Type[ItemType],
+        *,
+        key: Union[str, None]
+    ) -> Union[Injectable[ItemType], List[Injectable[ItemType]], None]:
+        key = key or generate_iface_key(iface)
+        return self.items.find(key)
+
     def get_list(
         self,
         iface: Type[ItemType],
@@ -521,38 +698,44 @@ class Provider(Generic[ItemType]):
 
     def describe_injectables(self) -> List[InjectableMeta]:
         results = []
-        for key, item in self.items.dict().items():
+        for key, item in self.iter_injectables():
             results.append({
                 'key': key,
                 'item': item,
             })
         return results
 
+    def iter_injectables(self) -> Iterator[
+        Tuple[str, Union[Injectable, List[Injectable]]]
+    ]:
+        yield from self.items.dict().items()
+
 
 class Injector(Generic[ItemType]):
+    __slots__ = ('_providers', '_context', '_cached')
 
     def __init__(self, providers: List[Provider], context: 'Context'):
         self._providers = providers
         self._context = context
-        self._cached = Registry()
+        self._cached: Dict[str, Any] = {}
 
     def get(
         self,
         iface: Type[ItemType],
         *,
         key: Union[str, None],
-        args: List[Any],
-        kwargs: Dict[str, Any]
+        args: Sequence[Any],
+        kwargs: Mapping[str, Any]
     ) -> ItemType:
+        lookup_key = key or generate_iface_key(iface)
         for provider in self._providers:
-            try:
+            injectable = provider.find(iface, key=lookup_key)
+            if injectable is not None:
                 return self._inject(
-                    provider.get(iface, key=key),
+                    cast(Injectable[ItemType], injectable),
                     args,
                     kwargs
                 )
-            except ItemNotFound:
-                pass
 
         raise InjectionError(iface, key=key)
 
@@ -561,65 +744,88 @@ class Injector(Generic[ItemType]):
         iface: Type[ItemType],
         *,
         key: Union[str, None],
-        args: List[Any],
-        kwargs: Dict[str, Any]
+        args: Sequence[Any],
+        kwargs: Mapping[str, Any]
     ) -> List[ItemType]:
+        lookup_key = key or generate_iface_key(iface)
         for provider in self._providers:
-            try:
+            injectables = provider.find(iface, key=lookup_key)
+            if injectables is not None:
+                assert isinstance(injectables, list)
                 return [
                     self._inject(
                         injectable,
                         args,
                         kwargs
                     )
-                    for injectable in provider.get_list(iface, key=key)
+                    for injectable in injectables
                 ]
-            except ItemNotFound:
-                pass
 
         raise InjectionError(iface, key=key)
 
-    def _cache(self, key: str, instance: ItemType):
-        self._cached.register(
-            Instance(instance),
-            key,
-            force=False,
-            aslist=False
-        )
-
-    def _get_from_cache(
-        self,
-        key: str
-    ) -> Injectable[ItemType]:
-        return self._cached.get(key)
-
     def _inject(
         self,
         injectable: Injectable[ItemType],
-        args: List[Any],
-        kwargs: Dict[str, Any]
+        args: Sequence[Any],
+        kwargs: Mapping[str, Any]
     ) -> ItemType:
         key = injectable.get_cache_key(args, kwargs)
         if key:
-            try:
-                return self.resolve(
-                    self._get_from_cache(key),
-                    args,
-                    kwargs
-                )
-            except ItemNotFound:
-                pass
+            instance = self._cached.get(key, _MISSING)
+            if instance is not _MISSING:
+                return instance
+
+        if args or kwargs or isinstance(injectable, Instance):
+            # Instances never re-enter and factories may legitimately
+            # recurse on themselves with different args. Dependencies
+            # are always injected without args so a cycle always goes
+            # through the other branch.
+            instance = self.resolve(injectable, args, kwargs)
+        else:
+            instance = self._resolve_tracked(injectable, args, kwargs)
 
-        instance = self.resolve(injectable, args, kwargs)
         if key:
-            self._cache(key, instance)
+            self._cached[key] = instance
 
         return instance
 
+    def _resolve_tracked(
+        self,
+        injectable: Injectable[ItemType],
+        args: Sequence[Any],
+        kwargs: Mapping[str, Any]
+    ) -> ItemType:
+        resolving = getattr(_resolution, 'path', None)
+        if resolving is None:
+            resolving = _resolution.path = {}
+
+        node = (self, injectable)
+        if node in resolving:
+            nodes = list(resolving)
+            path = [
+                node_injectable
+                for injector, node_injectable
+                in nodes[nodes.index(node):]
+                if injector is self
+            ]
+            path.append(injectable)
+            raise CircularDependencyError(path)
+
+        resolving[node] = None
+        try:
+            return self.resolve(injectable, args, kwargs)
+        finally:
+            del resolving[node]
+
     def resolve(
         self,
         injectable: Injectable[ItemType],
-        args: List[Any],
-        kwargs: Dict[str, Any]
+        args: Sequence[Any],
+        kwargs: Mapping[str, Any]
     ) -> ItemType:
+        if type(injectable) not in _COPYING_INJECTABLES:
+            # Custom injectables may mutate args and kwargs, don't let
+            # them change the caller's
+            args = list(args)
+            kwargs = dict(kwargs)
         return injectable(self._context, args, kwargs)
@@ -11,5 +11,5 @@ def app():
 
 @pytest.fixture(scope='function')
 def context():
-    context = Context(providers=[])
+    context = Context()
     return context
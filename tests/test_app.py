@@ -103,6 +103,18 @@ class TestRegistration:
         a = context.get(self._ClassA)
         assert isinstance(a, self._ClassA)
 
+    def test_register_unhashable_class(self, app: App):
+        class _Meta(type):
+            def __eq__(cls, other):
+                return cls is other
+
+        class _ClassU(metaclass=_Meta):
+            pass
+
+        app.factory(_ClassU)
+        context = app.create_context(Context)
+        assert isinstance(context.get(_ClassU), _ClassU)
+
     def test_register_force(self, app: App):
         app.factory(self._ClassA, iface=self._IClass)
         with pytest.raises(ItemExists):
@@ -207,6 +219,11 @@ class TestInclude:
         app.include('stirrups')
         assert len(app._includes) == 1
 
+    def test_include_once(self, app: App):
+        app.include('stirrups')
+        app.include('stirrups')
+        assert len(app._includes) == 1
+
     def test_include_invalid(self):
         app = App(mount='foo')
         with pytest.raises(IncludeModuleError):
@@ -1,8 +1,14 @@
+import threading
+
 import pytest
 
 from stirrups.app import App
 from stirrups.context import Context
-from stirrups.exceptions import DependencyInjectionError
+from stirrups.injection import Instance, injectable_factory
+from stirrups.exceptions import (
+    CircularDependencyError,
+    DependencyInjectionError
+)
 
 
 class TestRegistration:
@@ -39,6 +45,14 @@ class TestInjection:
         def __init__(self, deps_b: 'TestInjection._DepsB'):
             self.deps_b = deps_b
 
+    class _CycleA:
+        def __init__(self, b: 'TestInjection._CycleB'):
+            self.b = b
+
+    class _CycleB:
+        def __init__(self, a: 'TestInjection._CycleA'):
+            self.a = a
+
     def test_inject_factory_function(self, context: Context):
         def deps_a_factory() -> TestInjection._DepsA:
             return self._DepsA()
@@ -75,6 +89,105 @@ class TestInjection:
         b = context.get(self._ClassB)
         assert isinstance(b, self._ClassB)
 
+    def test_inject_does_not_mutate_args(self, context: Context):
+        context.factory(self._DepsA)
+        context.factory(self._ClassA, cache=False)
+
+        args = [1]
+        a = context.get(self._ClassA, args=args)
+        assert a.v == 1
+        assert args == [1]
+
+    def test_custom_injectable_gets_copies(self, context: Context):
+        class _Recorder(Instance):
+            def __call__(self, context, args, kwargs):
+                assert 'seen' not in kwargs
+                args.append(2)
+                kwargs['seen'] = True
+                return self.item
+
+        context.register(_Recorder(self._DepsA()), iface=self._DepsA)
+
+        args = [1]
+        context.get(self._DepsA, args=args)
+        context.get(self._DepsA)
+        assert args == [1]
+
+    def test_inject_circular_dependency(self, context: Context):
+        context.factory(TestInjection._CycleA)
+        context.factory(TestInjection._CycleB)
+
+        with pytest.raises(CircularDependencyError):
+            context.get(self._CycleA)
+
+    def test_inject_recursive_factory(self, context: Context):
+        def tree_factory(
+            context: Context,
+            depth: int = 2
+        ) -> TestInjection._IClass:
+            if not depth:
+                return []
+            return [context.get(self._IClass, kwargs={'depth': depth - 1})]
+
+        context.factory(tree_factory, iface=self._IClass, cache=False)
+        tree = context.get(self._IClass, kwargs={'depth': 2})
+        assert tree == [[[]]]
+
+    def test_inject_concurrently(self, context: Context):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def slow_factory() -> TestInjection._ClassA:
+            # Both threads are resolving the factory at the same time
+            barrier.wait()
+            return self._ClassA(1, self._DepsA())
+
+        context.factory(slow_factory, iface=self._IClass, cache=False)
+
+        errors = []
+
+        def get():
+            try:
+                context.get(self._IClass)
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=get) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == []
+
+    def test_cache_none_instance(self, context: Context):
+        calls = []
+
+        def none_factory() -> None:
+            calls.append(1)
+            return None
+
+        context.factory(none_factory, iface=self._IClass)
+        assert context.get(self._IClass) is None
+        assert context.get(self._IClass) is None
+        assert len(calls) == 1
+
+    def test_resolve_factory_function(self, context: Context):
+        def a_factory(
+            v: int,
+            deps_a: TestInjection._DepsA,
+        ) -> TestInjection._ClassA:
+            return self._ClassA(v, deps_a)
+
+        context.factory(self._DepsA)
+
+        # The factory is introspected once and resolved twice
+        a1 = context.resolve(a_factory, args=[1])
+        a2 = context.resolve(a_factory, args=[2])
+        assert injectable_factory(a_factory, cache=False).plan \
+            is injectable_factory(a_factory, cache=False).plan
+        assert a1.v == 1
+        assert a2.v == 2
+        assert a1.deps_a == a2.deps_a
+
 
 class TestInspect:
 